@@ -2,7 +2,9 @@
 Interactive builder for gold standard corpus.
 Each annotation: original clause + manual simplification + entity tags.
 """
-import json
+import copy
+import orjson
+import sys
 from pathlib import Path
 from typing import Tuple, List, Dict, Optional
 
@@ -19,8 +21,32 @@ CLAUSE_TYPES = [
     "general_provision",
 ]
 
+# Interned frozenset: O(1) membership, and downstream == on clause types
+# is a pointer compare
+CLAUSE_TYPES_SET = frozenset(sys.intern(c) for c in CLAUSE_TYPES)
+
+VALID_ROLES = frozenset({"obligor", "beneficiary", "third-party", "general"})
+
 GOLD_ROOT = Path(__file__).parent / "gold_corpus"
 
+# Frozen prototype deep-copied per annotation instead of rebuilding the
+# nested literal on every call
+_TEMPLATE_PROTO = {
+    "id": "",
+    "clause_type": "",
+    "original_text": "",
+    "gold_simplification": "",  # User fills this
+    "entities": {
+        "parties": [],  # [{"text": "Party A", "role": "obligor"}, ...]
+        "obligations": [],  # ["defend", "indemnify", ...]
+        "coverage": [],  # ["claims", "damages", ...]
+        "exceptions": [],  # ["gross negligence", ...]
+        "amounts": [],  # ["₹5,00,000", ...]
+        "deadlines": [],  # ["within 30 days", ...]
+    },
+    "key_facts": [],  # 2-3 critical points to preserve
+}
+
 
 class GoldCorpusBuilder:
     """Build and validate gold-standard clause annotations."""
@@ -28,6 +54,9 @@ class GoldCorpusBuilder:
     def __init__(self, root: Path = GOLD_ROOT):
         self.root = root
         self.root.mkdir(parents=True, exist_ok=True)
+        # Counted once here, then kept current on save — avoids a full
+        # corpus walk after every annotation
+        self._annotation_count = sum(1 for _ in self.root.glob("*/*.json"))
     
     def create_annotation_template(
         self, 
@@ -36,24 +65,14 @@ class GoldCorpusBuilder:
         clause_id: str
     ) -> Dict:
         """Generate annotation template for user to fill."""
-        if clause_type not in CLAUSE_TYPES:
+        if clause_type not in CLAUSE_TYPES_SET:
             raise ValueError(f"Invalid clause_type: {clause_type}")
-        
-        return {
-            "id": clause_id,
-            "clause_type": clause_type,
-            "original_text": clause_text.strip(),
-            "gold_simplification": "",  # User fills this
-            "entities": {
-                "parties": [],  # [{"text": "Party A", "role": "obligor"}, ...]
-                "obligations": [],  # ["defend", "indemnify", ...]
-                "coverage": [],  # ["claims", "damages", ...]
-                "exceptions": [],  # ["gross negligence", ...]
-                "amounts": [],  # ["₹5,00,000", ...]
-                "deadlines": [],  # ["within 30 days", ...]
-            },
-            "key_facts": [],  # 2-3 critical points to preserve
-        }
+
+        template = copy.deepcopy(_TEMPLATE_PROTO)
+        template["id"] = clause_id
+        template["clause_type"] = clause_type
+        template["original_text"] = clause_text.strip()
+        return template
     
     def save_annotation(self, annotation: Dict) -> Path:
         """Save annotation to typed subfolder."""
@@ -65,9 +84,12 @@ class GoldCorpusBuilder:
         
         out_path = out_dir / f"{clause_id}.json"
         
-        with out_path.open("w", encoding="utf-8") as f:
-            json.dump(annotation, f, ensure_ascii=False, indent=2)
-        
+        is_new = not out_path.exists()
+        with out_path.open("wb") as f:
+            f.write(orjson.dumps(annotation, option=orjson.OPT_INDENT_2))
+        if is_new:
+            self._annotation_count += 1
+
         return out_path
     
     def validate_annotation(self, annotation: Dict) -> Tuple[bool, List[str]]:
@@ -80,7 +102,7 @@ class GoldCorpusBuilder:
                 errors.append(f"Missing or empty: {field}")
         
         # Clause type validation
-        if annotation.get("clause_type") not in CLAUSE_TYPES:
+        if annotation.get("clause_type") not in CLAUSE_TYPES_SET:
             errors.append(f"Invalid clause_type: {annotation.get('clause_type')}")
         
         entities = annotation.get("entities", {})
@@ -93,6 +115,8 @@ class GoldCorpusBuilder:
         for party in parties:
             if not party.get("text") or not party.get("role"):
                 errors.append("Each party needs 'text' and 'role'")
+            elif party["role"] not in VALID_ROLES:
+                errors.append(f"Invalid party role: {party['role']}")
         
         # Obligations/coverage for non-general clauses
         if annotation.get("clause_type") != "general_provision":
@@ -120,7 +144,7 @@ class GoldCorpusBuilder:
             if clause_type.lower() == 'exit':
                 break
             
-            if clause_type not in CLAUSE_TYPES:
+            if clause_type not in CLAUSE_TYPES_SET:
                 print(f"  ✗ Invalid. Must be one of: {CLAUSE_TYPES}")
                 continue
             
@@ -237,9 +261,7 @@ class GoldCorpusBuilder:
             path = self.save_annotation(annotation)
             print(f"  ✓ Saved to {path}")
             
-            # Count existing
-            total = sum(1 for _ in self.root.glob("*/*.json"))
-            print(f"  Total annotations: {total}")
+            print(f"  Total annotations: {self._annotation_count}")
 
 
 if __name__ == "__main__":
@@ -50,12 +50,14 @@ def test_metrics_on_gold():
     }
     
     # Since we don't have extracted entities from simplified,
-    # do a simple heuristic check
+    # do a simple heuristic check. Lowercase once instead of once per
+    # candidate string.
+    simp_lower = simplified.lower()
     simplified_entities = {
         "parties": original_entities["parties"],  # Assume same
-        "obligations": [o for o in original_entities["obligations"] if o.lower() in simplified.lower()],
+        "obligations": [o for o in original_entities["obligations"] if o.lower() in simp_lower],
         "amounts": [a for a in original_entities["amounts"] if a in simplified],
-        "exceptions": [e for e in original_entities["exceptions"] if e.lower() in simplified.lower()],
+        "exceptions": [e for e in original_entities["exceptions"] if e.lower() in simp_lower],
     }
     
     # Calculate metrics
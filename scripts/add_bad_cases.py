@@ -1,23 +1,71 @@
-import csv
-from datetime import datetime
+import time
 from pathlib import Path
 
 LABELS_PATH = Path("data/known_bad/labels.csv")
 
+_VALID_TAGS: frozenset = frozenset(
+    ("too_long", "too_technical", "struct_lost", "hallucination")
+)
+
+
+class BadCaseWriter:
+    """Appends bad-case rows through one buffered file handle.
+
+    Batch imports that loop over many cases reuse the open handle and
+    write each pre-formatted row with a single f.write, instead of
+    paying an open/close and csv.writer setup per row.
+    """
+
+    def __init__(self, path: Path = LABELS_PATH):
+        self.path = path
+        self._f = None
+        self._ts_minute = -1
+        self._ts_prefix = ""
+
+    def write(self, doc_id: str, tag: str, comment: str) -> None:
+        if tag not in _VALID_TAGS:
+            raise ValueError(f"Invalid tag: {tag}")
+
+        if self._f is None:
+            self._f = self.path.open("a", buffering=8192, newline="", encoding="utf-8")
+
+        # Pre-assembled row, quoted the way csv.writer would quote it
+        comment_quoted = '"{}"'.format(comment.replace('"', '""'))
+        self._f.write(f"{doc_id},{tag},{comment_quoted},{self._timestamp()}\n")
+
+    def _timestamp(self) -> str:
+        """ISO-8601 UTC timestamp with the minute prefix cached.
+
+        Bulk imports call this per row; only the seconds field changes
+        within a minute, so the strftime runs at most once per minute
+        instead of building a datetime object per write.
+        """
+        now = time.time()
+        minute = int(now // 60)
+        if minute != self._ts_minute:
+            self._ts_prefix = time.strftime("%Y-%m-%dT%H:%M", time.gmtime(now))
+            self._ts_minute = minute
+        return f"{self._ts_prefix}:{now % 60:06.3f}"
+
+    def close(self) -> None:
+        if self._f is not None:
+            self._f.close()
+            self._f = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
 def add_bad_case(doc_id: str, tag: str, comment: str) -> None:
-    if tag not in {"too_long", "too_technical", "struct_lost", "hallucination"}:
-        raise ValueError(f"Invalid tag: {tag}")
-
-    with LABELS_PATH.open("a", newline="", encoding="utf-8") as f:
-        writer = csv.writer(f)
-        writer.writerow([
-            doc_id,
-            tag,
-            comment,
-            datetime.utcnow().isoformat()
-        ])
+    """One-shot wrapper for interactive use."""
+    with BadCaseWriter() as writer:
+        writer.write(doc_id, tag, comment)
     print(f"Added: {doc_id} | {tag}")
 
+
 if __name__ == "__main__":
     doc_id = input("doc_id (e.g., doc_001): ").strip()
     tag = input("tag (too_long|too_technical|struct_lost|hallucination): ").strip()
@@ -1,11 +1,14 @@
+import argparse
 import csv
-import json
-import statistics
+import threading
 import time
-from datetime import datetime
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait
+from datetime import datetime, timezone
 from pathlib import Path
 
 import httpx
+from hdrh.histogram import HdrHistogram
 
 BACKEND_URL = "http://127.0.0.1:8000"
 STRESS_DOCS = [
@@ -17,82 +20,134 @@ STRESS_DOCS = [
 ]
 
 
-def run_stress_test(num_requests: int = 20):
-    """Run stress test and measure latency."""
+# Each worker thread collects into its own deques and registers them
+# once; nothing shared is touched per request, so samples never
+# serialize on a lock (or on one hot list's append) mid-run.
+_local = threading.local()
+_collectors: list = []
+_collectors_lock = threading.Lock()
+
+
+def _thread_collectors():
+    try:
+        return _local.latencies, _local.errors
+    except AttributeError:
+        _local.latencies = deque()
+        _local.errors = deque()
+        with _collectors_lock:
+            _collectors.append((_local.latencies, _local.errors))
+        return _local.latencies, _local.errors
+
+
+def fire_one(client: httpx.Client, i: int):
+    """Send one request, recording into this thread's collectors."""
+    latencies, errors = _thread_collectors()
+    doc_text = STRESS_DOCS[i % len(STRESS_DOCS)]
+    payload = {
+        "text": doc_text,
+        "document_type": "contract",
+        "target_level": "simple",
+        "language": "en",
+    }
+
+    # perf_counter_ns is monotonic and integer — no float conversion
+    # per sample, and wall-clock time can jump mid-request
+    start = time.perf_counter_ns()
+    try:
+        resp = client.post(f"{BACKEND_URL}/simplify/text", json=payload)
+    except httpx.TimeoutException:
+        errors.append({"request": i + 1, "error": "TIMEOUT"})
+        print(f"✗ Request {i+1}: TIMEOUT")
+        return
+    except Exception as e:
+        errors.append({"request": i + 1, "error": str(e)})
+        print(f"✗ Request {i+1}: {str(e)}")
+        return
+    elapsed_ns = time.perf_counter_ns() - start
+
+    if resp.status_code == 200:
+        latencies.append(elapsed_ns)
+        print(f"✓ Request {i+1}: {elapsed_ns / 1e9:.2f}s")
+    else:
+        code = resp.json().get("code")
+        errors.append({"request": i + 1, "status": resp.status_code, "code": code})
+        print(f"✗ Request {i+1}: {code} ({resp.status_code})")
+
+
+def run_stress_test(num_requests: int = 20, concurrency: int = 8):
+    """Fire num_requests concurrent requests and measure latency.
+
+    Requests are submitted through a thread pool so percentiles reflect
+    queueing at the backend under real concurrent load, not a serial
+    best case.
+    """
     results = {
-        "latencies": [],
+        # 1µs to 10min at 3 significant figures, O(1) recording and
+        # constant memory regardless of request count
+        "histogram": HdrHistogram(1, 600_000_000, 3),
         "errors": [],
         "success_count": 0,
-        "timestamp": datetime.utcnow().isoformat(),
+        "concurrency": concurrency,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
     }
-    
-    client = httpx.Client(timeout=180)
-    
-    for i in range(num_requests):
-        doc_text = STRESS_DOCS[i % len(STRESS_DOCS)]
-        payload = {
-            "text": doc_text,
-            "document_type": "contract",
-            "target_level": "simple",
-            "language": "en",
-        }
-        
-        try:
-            start = time.time()
-            resp = client.post(f"{BACKEND_URL}/simplify/text", json=payload)
-            elapsed = time.time() - start
-            
-            if resp.status_code == 200:
-                results["latencies"].append(elapsed)
-                results["success_count"] += 1
-                print(f"✓ Request {i+1}: {elapsed:.2f}s")
-            else:
-                error_data = resp.json()
-                results["errors"].append({
-                    "request": i + 1,
-                    "status": resp.status_code,
-                    "code": error_data.get("code"),
-                })
-                print(f"✗ Request {i+1}: {error_data.get('code')} ({resp.status_code})")
-                
-        except httpx.TimeoutException:
-            results["errors"].append({"request": i + 1, "error": "TIMEOUT"})
-            print(f"✗ Request {i+1}: TIMEOUT")
-        except Exception as e:
-            results["errors"].append({"request": i + 1, "error": str(e)})
-            print(f"✗ Request {i+1}: {str(e)}")
-    
+
+    # Pooled keep-alive client shared by all workers; HTTP/2 multiplexes
+    # concurrent requests instead of serializing on one connection
+    client = httpx.Client(
+        http2=True,
+        limits=httpx.Limits(
+            max_connections=32,
+            max_keepalive_connections=16,
+            keepalive_expiry=60.0,
+        ),
+        transport=httpx.HTTPTransport(retries=1),
+        timeout=httpx.Timeout(connect=5, read=180, write=30, pool=5),
+    )
+
+    _collectors.clear()
+    with ThreadPoolExecutor(max_workers=concurrency) as ex:
+        wait([ex.submit(fire_one, client, i) for i in range(num_requests)])
+
+    # Single merge after the pool drains: one histogram record per
+    # sample instead of cross-thread appends during the hot loop
+    for latencies, errors in _collectors:
+        for elapsed_ns in latencies:
+            results["histogram"].record_value(elapsed_ns // 1_000)
+        results["success_count"] += len(latencies)
+        results["errors"].extend(errors)
+
     client.close()
     return results
 
 
 def calculate_metrics(results):
-    """Calculate p50, p95, p99 latencies."""
-    if not results["latencies"]:
+    """Latency percentiles (seconds) from the HDR histogram."""
+    hist = results["histogram"]
+    if hist.get_total_count() == 0:
         return {}
-    
-    latencies = sorted(results["latencies"])
+
     return {
-        "p50": statistics.median(latencies),
-        "p95": latencies[int(len(latencies) * 0.95)] if len(latencies) >= 20 else latencies[-1],
-        "p99": latencies[int(len(latencies) * 0.99)] if len(latencies) >= 100 else latencies[-1],
-        "mean": statistics.mean(latencies),
-        "min": min(latencies),
-        "max": max(latencies),
+        "p50": hist.get_value_at_percentile(50) / 1e6,
+        "p95": hist.get_value_at_percentile(95) / 1e6,
+        "p99": hist.get_value_at_percentile(99) / 1e6,
+        "p999": hist.get_value_at_percentile(99.9) / 1e6,
+        "mean": hist.get_mean_value() / 1e6,
+        "min": hist.get_min_value() / 1e6,
+        "max": hist.get_max_value() / 1e6,
     }
 
 
 def save_metrics(results, metrics):
     """Save metrics to CSV."""
     Path("metrics").mkdir(exist_ok=True)
-    csv_path = Path("metrics") / f"stress_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.csv"
+    csv_path = Path("metrics") / f"stress_{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')}.csv"
     
     with open(csv_path, "w", newline="") as f:
         writer = csv.writer(f)
         writer.writerow(["metric", "value"])
         writer.writerow(["timestamp", results["timestamp"]])
         writer.writerow(["success_count", results["success_count"]])
-        writer.writerow(["total_requests", len(results["latencies"]) + len(results["errors"])])
+        writer.writerow(["total_requests", results["success_count"] + len(results["errors"])])
         writer.writerow(["error_count", len(results["errors"])])
         
         for metric_name, metric_value in metrics.items():
@@ -103,13 +158,18 @@ def save_metrics(results, metrics):
 
 
 if __name__ == "__main__":
-    print("Running stress test (20 requests)...")
-    results = run_stress_test(20)
+    parser = argparse.ArgumentParser(description="Stress the /simplify/text endpoint")
+    parser.add_argument("--requests", type=int, default=20, help="total requests to send")
+    parser.add_argument("--concurrency", type=int, default=8, help="in-flight requests")
+    args = parser.parse_args()
+
+    print(f"Running stress test ({args.requests} requests, concurrency {args.concurrency})...")
+    results = run_stress_test(args.requests, args.concurrency)
     metrics = calculate_metrics(results)
-    
+
     print(f"\nResults:")
-    print(f"Success: {results['success_count']}/20")
+    print(f"Success: {results['success_count']}/{args.requests}")
     print(f"Errors: {len(results['errors'])}")
     print(f"Metrics: {metrics}")
-    
+
     save_metrics(results, metrics)
@@ -0,0 +1,20 @@
+import orjson
+from fastapi import Response
+
+
+class ORJSONResponse(Response):
+    """JSON response rendered with orjson instead of stdlib json.
+
+    Handles datetime/UUID/numpy natively and serializes several times
+    faster than the default JSONResponse, which matters on every route
+    that returns a plain dict.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(
+            content,
+            default=str,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+        )
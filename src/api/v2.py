@@ -1,17 +1,42 @@
+import asyncio
+
 from fastapi import APIRouter, Depends
+from redis import asyncio as aioredis
 from sqlalchemy.orm import Session
 
+from src.config import settings
 from src.database import get_db
 from src.tasks import simplify_document_async
 
 v2_router = APIRouter(prefix="/api/v2", tags=["v2"])
 
+# Shared async Redis client for task dedup locks
+redis = aioredis.from_url(settings.redis_url, decode_responses=True)
+
 
 @v2_router.post("/documents/upload/async")
 async def upload_document_async(doc_id: int, db: Session = Depends(get_db)):
-    """Queue document for background simplification."""
-    # yahan optionally check kar sakte ho ki document exist karta hai
-    task = simplify_document_async.delay(doc_id)
+    """Queue document for background simplification.
+
+    The enqueue is deduplicated with a Redis SETNX lock so retry-happy
+    clients don't spawn duplicate pipeline work for the same document,
+    and the blocking broker publish runs in a thread instead of holding
+    the event loop.
+    """
+    lock_key = f"simplify:lock:{doc_id}"
+    acquired = await redis.set(lock_key, "1", ex=300, nx=True)
+    if not acquired:
+        existing = await redis.get(f"simplify:task:{doc_id}")
+        return {
+            "task_id": existing,
+            "status": "already_processing",
+            "document_id": doc_id,
+        }
+
+    task = await asyncio.to_thread(
+        simplify_document_async.apply_async, args=(doc_id,)
+    )
+    await redis.set(f"simplify:task:{doc_id}", task.id, ex=3600)
     return {
         "task_id": task.id,
         "status": "processing",
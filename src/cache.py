@@ -1,29 +1,39 @@
+import time
+from collections import OrderedDict
 from functools import wraps
-import hashlib
-from datetime import datetime, timedelta
 
 
 class SimpleCache:
-    def __init__(self):
-        self.cache = {}
-        self.timestamps = {}
-
-    def get(self, key: str, ttl_seconds: int = 3600):
-        if key in self.cache:
-            if datetime.now() - self.timestamps[key] < timedelta(seconds=ttl_seconds):
-                return self.cache[key]
-            else:
-                del self.cache[key]
-                del self.timestamps[key]
-        return None
-
-    def set(self, key: str, value):
-        self.cache[key] = value
-        self.timestamps[key] = datetime.now()
+    """Bounded in-process LRU cache with integer TTL stamps.
+
+    Entries are (monotonic_ns, value) tuples in one OrderedDict, so a
+    hot get is a dict lookup plus an int subtract — no datetime or
+    timedelta objects — and eviction keeps memory bounded under load.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self.cache = OrderedDict()
+
+    def get(self, key, ttl_seconds: int = 3600):
+        entry = self.cache.get(key)
+        if entry is None:
+            return None
+        ts, value = entry
+        if time.monotonic_ns() - ts > ttl_seconds * 1_000_000_000:
+            del self.cache[key]
+            return None
+        self.cache.move_to_end(key)
+        return value
+
+    def set(self, key, value):
+        self.cache[key] = (time.monotonic_ns(), value)
+        self.cache.move_to_end(key)
+        if len(self.cache) > self.maxsize:
+            self.cache.popitem(last=False)
 
     def clear(self):
         self.cache.clear()
-        self.timestamps.clear()
 
 
 cache = SimpleCache()
@@ -34,8 +44,8 @@ def cache_result(ttl_seconds: int = 300):
     def decorator(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
-            key_raw = f"{func.__name__}:{(args, kwargs)}"
-            key = hashlib.md5(key_raw.encode()).hexdigest()
+            # Raw hashable tuple — cheaper than hashing a repr string
+            key = (func.__name__, args, tuple(sorted(kwargs.items())))
 
             cached = cache.get(key, ttl_seconds)
             if cached is not None:
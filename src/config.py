@@ -2,13 +2,46 @@
 
 import os
 import logging
-from typing import List
+import re
+from functools import lru_cache
+from typing import Annotated, List
 from pathlib import Path
 from pydantic_settings import BaseSettings
-from pydantic import field_validator, Field, ConfigDict
+from pydantic import BeforeValidator, Field, ConfigDict
 
 logger = logging.getLogger(__name__)
 
+_TRUE_STRS = frozenset({"true", "1", "yes", "on"})
+_CSV_RE = re.compile(r"\s*,\s*")
+
+
+def _parse_csv(v):
+    """Split a comma-separated env string, stripping in one regex pass."""
+    if isinstance(v, str):
+        return [s for s in _CSV_RE.split(v.strip()) if s]
+    return v
+
+
+def _parse_bool(v):
+    """Parse string boolean values"""
+    if isinstance(v, str):
+        return v.lower() in _TRUE_STRS
+    return v
+
+
+# Shared via Annotated so pydantic registers one validator function
+# instead of near-identical per-field classmethods
+CSVList = Annotated[List[str], BeforeValidator(_parse_csv)]
+EnvBool = Annotated[bool, BeforeValidator(_parse_bool)]
+
+
+def mask_database_url(url: str) -> str:
+    """Credential-free form of the database URL for logs and /config."""
+    scheme, sep, rest = url.partition("://")
+    if not sep or "@" not in rest:
+        return url
+    return f"{scheme}://***:***@{rest.rsplit('@', 1)[1]}"
+
 
 class Settings(BaseSettings):
     """Application settings loaded from environment variables"""
@@ -17,13 +50,13 @@ class Settings(BaseSettings):
     app_name: str = Field(default="Legal Document Simplifier", env="APP_NAME")
     app_version: str = Field(default="1.0.0", env="APP_VERSION")
     environment: str = Field(default="development", env="ENVIRONMENT")
-    debug: bool = Field(default=False, env="DEBUG")
+    debug: EnvBool = Field(default=False, env="DEBUG")
     secret_key: str = Field(default="change-me-in-production", env="SECRET_KEY")
 
     # Database
     database_url: str = Field(default="sqlite:///./test.db", env="DATABASE_URL")
     database_pool_size: int = Field(default=5, env="DATABASE_POOL_SIZE")
-    database_echo: bool = Field(default=False, env="DATABASE_ECHO")
+    database_echo: EnvBool = Field(default=False, env="DATABASE_ECHO")
 
     # Redis (optional)
     redis_url: str = Field(default="redis://localhost:6379/0", env="REDIS_URL")
@@ -37,20 +70,23 @@ class Settings(BaseSettings):
     # Uploads
     upload_dir: str = Field(default="./uploads", env="UPLOAD_DIR")
     max_file_size: int = Field(default=52428800, env="MAX_FILE_SIZE")  # 50MB
-    allowed_extensions: List[str] = Field(default=["pdf", "docx", "txt"], env="ALLOWED_EXTENSIONS")
+    allowed_extensions: CSVList = Field(default=["pdf", "docx", "txt"], env="ALLOWED_EXTENSIONS")
 
     # Logging
     log_level: str = Field(default="INFO", env="LOG_LEVEL")
     log_file: str = Field(default="logs/app.log", env="LOG_FILE")
 
     # CORS
-    cors_origins: List[str] = Field(
+    cors_origins: CSVList = Field(
         default=["http://localhost:3000", "http://localhost:8000"],
         env="CORS_ORIGINS"
     )
 
     # Rate limiting
-    rate_limit_enabled: bool = Field(default=True, env="RATE_LIMIT_ENABLED")
+    rate_limit_enabled: EnvBool = Field(default=True, env="RATE_LIMIT_ENABLED")
+
+    # ML
+    quantize_model: EnvBool = Field(default=True, env="QUANTIZE_MODEL")
 
     # JWT/Security
     token_expire_minutes: int = Field(default=30, env="TOKEN_EXPIRE_MINUTES")
@@ -73,38 +109,6 @@ class Settings(BaseSettings):
         extra="ignore"  # Ignore extra environment variables not defined in Settings
     )
 
-    @field_validator("cors_origins", mode="before")
-    @classmethod
-    def parse_cors_origins(cls, v):
-        """Parse CORS origins from comma-separated string"""
-        if isinstance(v, str):
-            return [origin.strip() for origin in v.split(",") if origin.strip()]
-        return v
-
-    @field_validator("allowed_extensions", mode="before")
-    @classmethod
-    def parse_extensions(cls, v):
-        """Parse allowed extensions from comma-separated string"""
-        if isinstance(v, str):
-            return [ext.strip() for ext in v.split(",") if ext.strip()]
-        return v
-
-    @field_validator("debug", mode="before")
-    @classmethod
-    def parse_bool(cls, v):
-        """Parse string boolean values"""
-        if isinstance(v, str):
-            return v.lower() in ("true", "1", "yes", "on")
-        return v
-
-    @field_validator("rate_limit_enabled", mode="before")
-    @classmethod
-    def parse_rate_limit_bool(cls, v):
-        """Parse string boolean for rate limiting"""
-        if isinstance(v, str):
-            return v.lower() in ("true", "1", "yes", "on")
-        return v
-
     def validate_database_url(self) -> None:
         """Validate database URL is properly configured"""
         if not self.database_url:
@@ -121,14 +125,26 @@ class Settings(BaseSettings):
                 logger.warning("SENTRY_DSN not set in production; error tracking disabled")
 
 
-# Load settings with error handling
-try:
-    settings = Settings()
-    settings.validate_database_url()
-    settings.validate_production_config()
-    logger.info(f"✓ Configuration loaded for {settings.environment}")
-    logger.info(f"✓ Debug mode: {settings.debug}")
-    logger.info(f"✓ Database: {settings.database_url.split('@')[0] if '@' in settings.database_url else 'SQLite'}")
-except Exception as e:
-    logger.error(f"✗ Configuration error: {e}")
-    raise
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Build and validate Settings once per process.
+
+    Parsing .env and running the validators happens on first use rather
+    than at import; workers and tests re-importing this module share the
+    cached instance. Usable directly as a FastAPI dependency.
+    """
+    try:
+        s = Settings()
+        s.validate_database_url()
+        s.validate_production_config()
+        logger.info(f"✓ Configuration loaded for {s.environment}")
+        logger.info(f"✓ Debug mode: {s.debug}")
+        logger.info(f"✓ Database: {mask_database_url(s.database_url)}")
+        return s
+    except Exception as e:
+        logger.error(f"✗ Configuration error: {e}")
+        raise
+
+
+# Backward-compatible module-level instance; prefer get_settings()
+settings = get_settings()
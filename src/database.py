@@ -5,13 +5,18 @@ from src.config import settings
 
 DATABASE_URL = settings.database_url
 
+# Pool sized for concurrent workers plus liveness-probe traffic; LIFO
+# checkout keeps hot connections (and their server-side caches) in use
+# instead of round-robining across the whole pool
 engine = create_engine(
     DATABASE_URL,
     poolclass=QueuePool,
-    pool_size=5,
+    pool_size=20,
     max_overflow=10,
     pool_pre_ping=True,
-    pool_recycle=3600,
+    pool_recycle=1800,
+    pool_use_lifo=True,
+    insertmanyvalues_page_size=1000,
 )
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -1,20 +1,38 @@
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
-from sqlalchemy.pool import QueuePool
+from sqlalchemy.pool import QueuePool, StaticPool
 import os
 
 # SQLite for testing
 DATABASE_URL = "sqlite:///./test_legal_docs.db"
 
-engine = create_engine(
-    DATABASE_URL,
-    poolclass=QueuePool,
-    pool_size=5,
-    max_overflow=10,
-    pool_pre_ping=True,
-    pool_recycle=3600,
-    connect_args={"check_same_thread": False}
-)
+
+def _build_engine(url: str):
+    """Engine tuned per driver.
+
+    SQLite gets a StaticPool (one shared connection, no checkout
+    overhead) — pre-ping is pointless for an embedded file DB. Postgres
+    gets a QueuePool sized for concurrent workers without the per-
+    checkout SELECT 1 that pool_pre_ping issues; stale connections are
+    handled by recycle instead.
+    """
+    if url.startswith("sqlite"):
+        return create_engine(
+            url,
+            poolclass=StaticPool,
+            connect_args={"check_same_thread": False, "timeout": 30},
+        )
+    return create_engine(
+        url,
+        poolclass=QueuePool,
+        pool_size=max(20, (os.cpu_count() or 1) * 4),
+        max_overflow=40,
+        pool_pre_ping=False,
+        pool_recycle=1800,
+    )
+
+
+engine = _build_engine(DATABASE_URL)
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
@@ -1,4 +1,4 @@
-import json
+import orjson
 from datetime import datetime
 from pathlib import Path
 
@@ -6,6 +6,13 @@ class JSONExporter:
     def export(self, filename, simplify_output, upload_timestamp):
         """Export analysis data as JSON"""
         
+        # Bind each section once instead of re-checking simplify_output
+        # and re-fetching the same keys in every branch
+        so = simplify_output or {}
+        clauses = so.get('clauses') or []
+        entities = so.get('entities') or []
+        risks = so.get('risks') or []
+
         data = {
             "metadata": {
                 "filename": str(Path(filename).name),
@@ -14,41 +21,36 @@ class JSONExporter:
                 "format_version": "1.0"
             },
             "analysis": {
-                "total_clauses": len(simplify_output.get('clauses', [])) if simplify_output else 0,
-                "total_entities": len(simplify_output.get('entities', [])) if simplify_output else 0,
-                "has_risk_assessment": bool(simplify_output.get('risks')) if simplify_output else False
+                "total_clauses": len(clauses),
+                "total_entities": len(entities),
+                "has_risk_assessment": bool(risks)
             },
-            "clauses": [],
-            "entities": [],
-            "risks": []
-        }
-        
-        # Add clauses
-        if simplify_output and simplify_output.get('clauses'):
-            for clause in simplify_output['clauses']:
-                data['clauses'].append({
+            "clauses": [
+                {
                     "title": clause.get('title', 'Untitled'),
                     "original": clause.get('original_text', ''),
                     "simplified": clause.get('simplified_text', ''),
                     "complexity_level": clause.get('complexity_level', 'unknown')
-                })
-        
-        # Add entities
-        if simplify_output and simplify_output.get('entities'):
-            for entity in simplify_output['entities']:
-                data['entities'].append({
+                }
+                for clause in clauses
+            ],
+            "entities": [
+                {
                     "type": entity.get('type', 'unknown'),
                     "value": entity.get('value', ''),
                     "confidence": entity.get('confidence', 0.0)
-                })
-        
-        # Add risks
-        if simplify_output and simplify_output.get('risks'):
-            for risk in simplify_output['risks']:
-                data['risks'].append({
+                }
+                for entity in entities
+            ],
+            "risks": [
+                {
                     "level": risk.get('level', 'unknown'),
                     "description": risk.get('description', ''),
                     "location": risk.get('location', '')
-                })
-        
-        return json.dumps(data, indent=2).encode('utf-8')
+                }
+                for risk in risks
+            ]
+        }
+
+        # orjson returns UTF-8 bytes directly — no encode round-trip
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
@@ -8,42 +8,63 @@ from io import BytesIO
 from datetime import datetime
 from pathlib import Path
 
+# Styles are constant across requests — build the stylesheet and table
+# styles once at import instead of per PDFGenerator instance
+_STYLES = getSampleStyleSheet()
+if 'CustomTitle' not in _STYLES:
+    _STYLES.add(ParagraphStyle(
+        name='CustomTitle',
+        parent=_STYLES['Heading1'],
+        fontSize=24,
+        textColor=colors.HexColor('#1a5c73'),
+        spaceAfter=30,
+        alignment=TA_CENTER,
+        fontName='Helvetica-Bold'
+    ))
+    _STYLES.add(ParagraphStyle(
+        name='SectionHeading',
+        parent=_STYLES['Heading2'],
+        fontSize=14,
+        textColor=colors.HexColor('#2a8aa3'),
+        spaceAfter=12,
+        spaceBefore=12,
+        fontName='Helvetica-Bold'
+    ))
+    _STYLES.add(ParagraphStyle(
+        name='ClauseText',
+        parent=_STYLES['BodyText'],
+        fontSize=10,
+        leftIndent=20,
+        spaceAfter=8,
+        alignment=TA_JUSTIFY
+    ))
+
+_META_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#e8f4f8')),
+    ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 10),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
+    ('GRID', (0, 0), (-1, -1), 1, colors.grey)
+])
+
+_ENTITY_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2a8aa3')),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 9),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+    ('GRID', (0, 0), (-1, -1), 1, colors.grey),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f0f0f0')])
+])
+
+
 class PDFGenerator:
     def __init__(self):
-        self.styles = getSampleStyleSheet()
-        self._setup_custom_styles()
-    
-    def _setup_custom_styles(self):
-        """Setup custom paragraph styles"""
-        self.styles.add(ParagraphStyle(
-            name='CustomTitle',
-            parent=self.styles['Heading1'],
-            fontSize=24,
-            textColor=colors.HexColor('#1a5c73'),
-            spaceAfter=30,
-            alignment=TA_CENTER,
-            fontName='Helvetica-Bold'
-        ))
-        
-        self.styles.add(ParagraphStyle(
-            name='SectionHeading',
-            parent=self.styles['Heading2'],
-            fontSize=14,
-            textColor=colors.HexColor('#2a8aa3'),
-            spaceAfter=12,
-            spaceBefore=12,
-            fontName='Helvetica-Bold'
-        ))
-        
-        self.styles.add(ParagraphStyle(
-            name='ClauseText',
-            parent=self.styles['BodyText'],
-            fontSize=10,
-            leftIndent=20,
-            spaceAfter=8,
-            alignment=TA_JUSTIFY
-        ))
-    
+        self.styles = _STYLES
+
     def generate(self, filename, simplify_output, timestamp):
         """Generate complete PDF report"""
         buffer = BytesIO()
@@ -75,15 +96,7 @@ class PDFGenerator:
         ]
         
         meta_table = Table(meta_data, colWidths=[2*inch, 4*inch])
-        meta_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#e8f4f8')),
-            ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
-            ('GRID', (0, 0), (-1, -1), 1, colors.grey)
-        ]))
+        meta_table.setStyle(_META_TABLE_STYLE)
         story.append(meta_table)
         story.append(PageBreak())
         
@@ -111,16 +124,7 @@ class PDFGenerator:
                 entity_data.append([entity.get('type', 'Unknown'), entity.get('value', 'N/A')])
             
             entity_table = Table(entity_data, colWidths=[2*inch, 4*inch])
-            entity_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2a8aa3')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, -1), 9),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-                ('GRID', (0, 0), (-1, -1), 1, colors.grey),
-                ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f0f0f0')])
-            ]))
+            entity_table.setStyle(_ENTITY_TABLE_STYLE)
             story.append(entity_table)
         
         story.append(Spacer(1, 0.3*inch))
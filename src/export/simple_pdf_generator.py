@@ -8,43 +8,43 @@ from io import BytesIO
 from datetime import datetime
 from pathlib import Path
 
+# Styles are constant across requests — build the stylesheet once at
+# import instead of per SimplePDFGenerator instance
+_STYLES = getSampleStyleSheet()
+if 'CustomTitle' not in _STYLES:
+    _STYLES.add(ParagraphStyle(
+        name='CustomTitle',
+        parent=_STYLES['Heading1'],
+        fontSize=20,
+        textColor=colors.HexColor('#1a5c73'),
+        spaceAfter=12,
+        alignment=TA_CENTER,
+        fontName='Helvetica-Bold'
+    ))
+    _STYLES.add(ParagraphStyle(
+        name='SectionHeading',
+        parent=_STYLES['Heading2'],
+        fontSize=12,
+        textColor=colors.HexColor('#2a8aa3'),
+        spaceAfter=10,
+        spaceBefore=10,
+        fontName='Helvetica-Bold'
+    ))
+    _STYLES.add(ParagraphStyle(
+        name='SimpleText',
+        parent=_STYLES['BodyText'],
+        fontSize=10,
+        leftIndent=0,
+        spaceAfter=12,
+        alignment=TA_JUSTIFY,
+        leading=14
+    ))
+
+
 class SimplePDFGenerator:
     def __init__(self):
-        self.styles = getSampleStyleSheet()
-        self._setup_custom_styles()
-    
-    def _setup_custom_styles(self):
-        """Setup custom paragraph styles"""
-        self.styles.add(ParagraphStyle(
-            name='CustomTitle',
-            parent=self.styles['Heading1'],
-            fontSize=20,
-            textColor=colors.HexColor('#1a5c73'),
-            spaceAfter=12,
-            alignment=TA_CENTER,
-            fontName='Helvetica-Bold'
-        ))
-        
-        self.styles.add(ParagraphStyle(
-            name='SectionHeading',
-            parent=self.styles['Heading2'],
-            fontSize=12,
-            textColor=colors.HexColor('#2a8aa3'),
-            spaceAfter=10,
-            spaceBefore=10,
-            fontName='Helvetica-Bold'
-        ))
-        
-        self.styles.add(ParagraphStyle(
-            name='SimpleText',
-            parent=self.styles['BodyText'],
-            fontSize=10,
-            leftIndent=0,
-            spaceAfter=12,
-            alignment=TA_JUSTIFY,
-            leading=14
-        ))
-    
+        self.styles = _STYLES
+
     def generate(self, filename, simplify_output, timestamp):
         """Generate simplified text-only PDF"""
         buffer = BytesIO()
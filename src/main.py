@@ -1,14 +1,25 @@
 from fastapi import FastAPI, UploadFile, File, Query, HTTPException
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, Response
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
 import uvicorn
-import json
+import asyncio
+import orjson
+import os
+import shutil
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime
-import PyPDF2
+import pypdfium2 as pdfium
 from docx import Document
+from functools import lru_cache
 
+from src.api.orjson_response import ORJSONResponse
+from src.config import settings, mask_database_url
+from src.middleware.observability import ObservabilityMiddleware
 from src.export.pdf_generator import PDFGenerator
 from src.export.json_exporter import JSONExporter
 from src.export.simple_pdf_generator import SimplePDFGenerator
@@ -22,8 +33,13 @@ app = FastAPI(
     title="Legal Document Simplifier",
     description="Phase 5: File Upload & Export",
     version="5.0.0",
+    default_response_class=ORJSONResponse,
 )
 
+# Single fused logging+metrics layer instead of stacking the separate
+# logging and metrics middlewares
+app.add_middleware(ObservabilityMiddleware)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -43,21 +59,67 @@ SESSION_DIR.mkdir(exist_ok=True)
 # Single shared pipeline instance (lazy singleton)
 pipeline = get_simplification_pipeline()
 
+# Frontend page cached in memory; read once at startup instead of a
+# disk read + decode per /app hit
+_INDEX_HTML = None
+
+
+@app.on_event("startup")
+def _load_index_html():
+    global _INDEX_HTML
+    index_path = Path("frontend/index.html")
+    _INDEX_HTML = index_path.read_bytes() if index_path.exists() else None
+
 # -----------------------------------------------------------------------------
 # Helper functions
 # -----------------------------------------------------------------------------
 
-def _extract_pdf_text(file_path: str) -> str:
-    text = ""
+# Worker processes for CPU-bound PDF text extraction; one pool for the
+# process lifetime so forks are paid once, not per request
+_EXTRACT_POOL = ProcessPoolExecutor(max_workers=os.cpu_count() or 1)
+
+
+def _extract_pdf_range(file_path: str, start: int, end: int) -> str:
+    """Extract text for pages [start, end) — runs in a worker process."""
+    pdf = pdfium.PdfDocument(file_path)
     try:
-        with open(file_path, "rb") as f:
-            reader = PyPDF2.PdfReader(f)
-            for page in reader.pages:
-                page_text = page.extract_text() or ""
-                text += page_text + "\n"
+        return "\n".join(
+            pdf[i].get_textpage().get_text_range() for i in range(start, end)
+        )
+    finally:
+        pdf.close()
+
+
+async def _extract_pdf_text(file_path: str) -> str:
+    """Extract all page text with pdfium, pages split across the pool.
+
+    PDFium is a C extension an order of magnitude faster than the old
+    PyPDF2 loop, and running the page ranges in worker processes keeps
+    the event loop free while a large document is extracted.
+    """
+    try:
+        pdf = pdfium.PdfDocument(file_path)
+        n_pages = len(pdf)
+        pdf.close()
+        if n_pages == 0:
+            return ""
+
+        workers = min(os.cpu_count() or 1, n_pages)
+        step = -(-n_pages // workers)
+        loop = asyncio.get_running_loop()
+        parts = await asyncio.gather(*[
+            loop.run_in_executor(
+                _EXTRACT_POOL,
+                _extract_pdf_range,
+                file_path,
+                start,
+                min(start + step, n_pages),
+            )
+            for start in range(0, n_pages, step)
+        ])
+        return "\n".join(parts).strip()
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"PDF extraction failed: {e}")
-    return text.strip()
 
 
 def _extract_docx_text(file_path: str) -> str:
@@ -76,17 +138,25 @@ def _session_json_path(session_id: str) -> Path:
 
 
 def _save_session(session_id: str, metadata: dict) -> None:
-    p = _session_json_path(session_id)
-    with open(p, "w", encoding="utf-8") as f:
-        json.dump(metadata, f, ensure_ascii=False)
+    # orjson serializes straight to UTF-8 bytes; write_bytes puts them
+    # on disk in one call with no text-mode encoding pass
+    _session_json_path(session_id).write_bytes(
+        orjson.dumps(metadata, option=orjson.OPT_NON_STR_KEYS)
+    )
+
+
+@lru_cache(maxsize=256)
+def _load_session_cached(session_id: str, mtime_ns: int) -> dict:
+    return orjson.loads(_session_json_path(session_id).read_bytes())
 
 
 def _load_session(session_id: str) -> dict:
+    # Sessions are written once at upload, so the parsed dict can be
+    # cached; keying on mtime_ns makes any rewrite a natural miss
     p = _session_json_path(session_id)
     if not p.exists():
         raise HTTPException(status_code=404, detail="Session not found")
-    with open(p, "r", encoding="utf-8") as f:
-        return json.load(f)
+    return _load_session_cached(session_id, p.stat().st_mtime_ns)
 
 # -----------------------------------------------------------------------------
 # Core endpoints
@@ -97,12 +167,77 @@ def root():
     return {"message": "Legal Document Simplifier - Phase 5", "frontend": "/app"}
 
 
+# Masked once at import — /config never re-splits the URL, and raw
+# credentials never reach a response
+_CONFIG_PAYLOAD = {
+    "app_name": settings.app_name,
+    "environment": settings.environment,
+    "debug": settings.debug,
+    "database_url": mask_database_url(settings.database_url),
+}
+
+
+@app.get("/config")
+def get_config():
+    return _CONFIG_PAYLOAD
+
+
+_HEALTH_TTL = 1.0
+_health_cache = (0.0, None)
+
+
+@app.get("/health")
+def health_check():
+    """Liveness probe.
+
+    The response dict is reused for 1s so probe storms (kube checks
+    every few seconds per replica) don't rebuild the timestamp and
+    re-serialize per hit.
+    """
+    global _health_cache
+    now = time.monotonic()
+    ts, cached = _health_cache
+    if cached is not None and now - ts < _HEALTH_TTL:
+        return cached
+
+    payload = {
+        "status": "healthy",
+        "version": app.version,
+        "timestamp": datetime.now().isoformat(),
+    }
+    _health_cache = (now, payload)
+    return payload
+
+
+_METRICS_TTL = 2.0
+_metrics_cache = (0.0, b"")
+
+
+@app.get("/metrics")
+async def metrics():
+    """Prometheus scrape endpoint.
+
+    generate_latest walks every series in the registry — O(series) and
+    synchronous — so it runs in the default executor instead of on the
+    event loop, and the rendered payload is shared for 2s so parallel
+    scrapers don't each pay for a full registry walk.
+    """
+    global _metrics_cache
+    now = time.monotonic()
+    ts, cached = _metrics_cache
+    if cached and now - ts < _METRICS_TTL:
+        data = cached
+    else:
+        data = await asyncio.get_running_loop().run_in_executor(None, generate_latest)
+        _metrics_cache = (now, data)
+    return Response(content=data, media_type=CONTENT_TYPE_LATEST)
+
+
 @app.get("/app", response_class=HTMLResponse)
 def serve_app():
-    index_path = Path("frontend/index.html")
-    if not index_path.exists():
+    if _INDEX_HTML is None:
         raise HTTPException(status_code=500, detail="frontend/index.html not found")
-    return index_path.read_text(encoding="utf-8")
+    return HTMLResponse(content=_INDEX_HTML)
 
 
 @app.post("/upload")
@@ -118,30 +253,43 @@ async def upload_file(file: UploadFile = File(...)):
         ]:
             raise HTTPException(status_code=400, detail="Only PDF and DOCX files allowed")
 
-        content = await file.read()
-        if len(content) > 25 * 1024 * 1024:
-            raise HTTPException(status_code=400, detail="File too large (max 25MB)")
-
-        session_id = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        # uuid4 is one urandom read — no strftime, and no collisions
+        # when two uploads land in the same microsecond
+        session_id = uuid.uuid4().hex
         session_dir = SESSION_DIR / session_id
         session_dir.mkdir(parents=True, exist_ok=True)
 
+        # Stream the upload to disk in 1 MB chunks; a full read() would
+        # hold the whole file in memory and copy it a second time on
+        # write, spiking RSS under concurrent uploads
         file_path = session_dir / file.filename
-        with open(file_path, "wb") as f:
-            f.write(content)
+        total = 0
+        try:
+            with open(file_path, "wb") as f:
+                while chunk := await file.read(1 << 20):
+                    total += len(chunk)
+                    if total > 25 * 1024 * 1024:
+                        raise HTTPException(status_code=400, detail="File too large (max 25MB)")
+                    f.write(chunk)
+        except HTTPException:
+            file_path.unlink(missing_ok=True)
+            raise
 
         if file.filename.lower().endswith(".pdf"):
-            text = _extract_pdf_text(str(file_path))
+            text = await _extract_pdf_text(str(file_path))
         else:
             text = _extract_docx_text(str(file_path))
 
         # Pipeline returns JSON string → parse to dict
         simplify_json = pipeline.simplify(text)
-        simplify_output = json.loads(simplify_json)
+        simplify_output = orjson.loads(simplify_json)
 
         metadata = {
             "session_id": session_id,
             "filename": file.filename,
+            # Precomputed once so export endpoints don't re-derive it
+            # for every Content-Disposition header
+            "stem": Path(file.filename).stem,
             "file_path": str(file_path),
             "upload_timestamp": datetime.now().isoformat(),
             "extracted_text": text,
@@ -149,12 +297,15 @@ async def upload_file(file: UploadFile = File(...)):
         }
         _save_session(session_id, metadata)
 
-        return {
+        # Return a prebuilt response: the payload was just parsed from
+        # pipeline JSON, so routing it through jsonable_encoder and
+        # response validation would only re-walk a large tree
+        return ORJSONResponse({
             "session_id": session_id,
             "filename": file.filename,
             "message": "File uploaded and processed successfully",
             "simplify_output": simplify_output,
-        }
+        })
     except HTTPException:
         raise
     except Exception as e:
@@ -164,26 +315,56 @@ async def upload_file(file: UploadFile = File(...)):
 # Exports
 # -----------------------------------------------------------------------------
 
+# PDF rendering is CPU-bound reportlab work; a small worker pool keeps
+# it off the event loop and the semaphore bounds how many renders can
+# queue before callers are told to retry
+_PDF_POOL = ProcessPoolExecutor(max_workers=min(4, os.cpu_count() or 1))
+_PDF_SEM = asyncio.Semaphore(8)
+
+
+def _render_pdf(metadata: dict) -> bytes:
+    """Runs in a worker process."""
+    return PDFGenerator().generate(
+        filename=metadata["filename"],
+        simplify_output=metadata["simplify_output"],
+        timestamp=metadata["upload_timestamp"],
+    )
+
+
+def _render_simple_pdf(metadata: dict) -> bytes:
+    """Runs in a worker process."""
+    return SimplePDFGenerator().generate(
+        filename=metadata["filename"],
+        simplify_output=metadata["simplify_output"],
+        timestamp=metadata["upload_timestamp"],
+    )
+
+
+_PDF_BUSY = Response(
+    content=b"PDF generation busy, retry shortly",
+    status_code=503,
+    headers={"Retry-After": "2"},
+)
+
+
 @app.post("/export/pdf")
 async def export_pdf(session_id: str = Query(...)):
     """Full analysis PDF."""
     try:
         metadata = _load_session(session_id)
-        gen = PDFGenerator()
-        pdf_bytes = gen.generate(
-            filename=metadata["filename"],
-            simplify_output=metadata["simplify_output"],
-            timestamp=metadata["upload_timestamp"],
-        )
-
-        # FastAPI FileResponse from bytes: use StreamingResponse-like pattern
-        from fastapi.responses import Response
-
+        if _PDF_SEM.locked():
+            return _PDF_BUSY
+        async with _PDF_SEM:
+            pdf_bytes = await asyncio.get_running_loop().run_in_executor(
+                _PDF_POOL, _render_pdf, metadata
+            )
+
+        stem = metadata.get("stem") or Path(metadata["filename"]).stem
         return Response(
             content=pdf_bytes,
             media_type="application/pdf",
             headers={
-                "Content-Disposition": f'attachment; filename="{Path(metadata["filename"]).stem}_report.pdf"'
+                "Content-Disposition": f'attachment; filename="{stem}_report.pdf"'
             },
         )
     except HTTPException:
@@ -197,20 +378,19 @@ async def export_simple_pdf(session_id: str = Query(...)):
     """Simplified-text-only PDF."""
     try:
         metadata = _load_session(session_id)
-        gen = SimplePDFGenerator()
-        pdf_bytes = gen.generate(
-            filename=metadata["filename"],
-            simplify_output=metadata["simplify_output"],
-            timestamp=metadata["upload_timestamp"],
-        )
-
-        from fastapi.responses import Response
-
+        if _PDF_SEM.locked():
+            return _PDF_BUSY
+        async with _PDF_SEM:
+            pdf_bytes = await asyncio.get_running_loop().run_in_executor(
+                _PDF_POOL, _render_simple_pdf, metadata
+            )
+
+        stem = metadata.get("stem") or Path(metadata["filename"]).stem
         return Response(
             content=pdf_bytes,
             media_type="application/pdf",
             headers={
-                "Content-Disposition": f'attachment; filename="{Path(metadata["filename"]).stem}_simplified.pdf"'
+                "Content-Disposition": f'attachment; filename="{stem}_simplified.pdf"'
             },
         )
     except HTTPException:
@@ -231,13 +411,12 @@ async def export_json(session_id: str = Query(...)):
             upload_timestamp=metadata["upload_timestamp"],
         )
 
-        from fastapi.responses import Response
-
+        stem = metadata.get("stem") or Path(metadata["filename"]).stem
         return Response(
             content=json_bytes,
             media_type="application/json",
             headers={
-                "Content-Disposition": f'attachment; filename="{Path(metadata["filename"]).stem}_data.json"'
+                "Content-Disposition": f'attachment; filename="{stem}_data.json"'
             },
         )
     except HTTPException:
@@ -266,16 +445,17 @@ def get_session(session_id: str):
 
 
 @app.delete("/session/{session_id}")
-def delete_session(session_id: str):
+async def delete_session(session_id: str):
     try:
+        # rmtree on a directory holding a 25MB upload is many syscalls;
+        # run both removals in a worker thread so they neither block the
+        # loop nor occupy the shared sync-endpoint threadpool.
+        # missing_ok/ignore_errors replace the exists() pre-checks — two
+        # fewer stat calls per delete.
         session_dir = SESSION_DIR / session_id
-        if session_dir.exists():
-            import shutil
-            shutil.rmtree(session_dir)
-
-        json_path = _session_json_path(session_id)
-        if json_path.exists():
-            json_path.unlink()
+        await asyncio.to_thread(shutil.rmtree, session_dir, ignore_errors=True)
+        await asyncio.to_thread(_session_json_path(session_id).unlink, missing_ok=True)
+        _load_session_cached.cache_clear()
 
         return {"status": "deleted", "session_id": session_id}
     except Exception as e:
@@ -286,17 +466,22 @@ def delete_session(session_id: str):
 # -----------------------------------------------------------------------------
 
 @app.get("/simplify/text")
-def simplify_text(text: str = Query(...), target_level: str = Query(default="simple")):
+async def simplify_text(text: str = Query(...), target_level: str = Query(default="simple")):
     """
     Phase‑4 style endpoint used by the new UI.
 
-    It calls SimplificationPipeline.simplify(text), which returns a JSON string,
-    then parses it to a dict so the frontend gets `summary`, `clauses`, etc.
+    It calls SimplificationPipeline.simplify(text), which already returns
+    the JSON the frontend expects (`summary`, `clauses`, etc.), so the
+    string passes straight through as the response body — no parse and
+    no re-serialization.
+
+    The pipeline is CPU-bound, so it runs via asyncio.to_thread — the
+    event loop stays responsive instead of every request contending on
+    the shared sync-endpoint threadpool.
     """
     try:
-        simplify_json = pipeline.simplify(text)
-        result = json.loads(simplify_json)
-        return result
+        simplify_json = await asyncio.to_thread(pipeline.simplify, text)
+        return Response(content=simplify_json, media_type="application/json")
     except Exception as e:
         import traceback
         print("ERROR in simplify_text:", e)
@@ -306,4 +491,14 @@ def simplify_text(text: str = Query(...), target_level: str = Query(default="sim
 # -----------------------------------------------------------------------------
 
 if __name__ == "__main__":
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # uvloop event loop + httptools parser are both C-implemented;
+    # access_log is off because ObservabilityMiddleware already logs
+    # every request
+    uvicorn.run(
+        app,
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        access_log=False,
+    )
@@ -1,4 +1,10 @@
 from .logging import RequestLoggingMiddleware, limiter
 from .metrics import MetricsMiddleware
+from .observability import ObservabilityMiddleware
 
-__all__ = ["RequestLoggingMiddleware", "MetricsMiddleware", "limiter"]
+__all__ = [
+    "RequestLoggingMiddleware",
+    "MetricsMiddleware",
+    "ObservabilityMiddleware",
+    "limiter",
+]
@@ -1,11 +1,9 @@
 import time
-from fastapi import Request
 from src.monitoring.metrics import (
     api_requests_total,
     request_duration_seconds,
     errors_total,
     active_requests,
-    record_request_timestamp,
 )
 
 
@@ -14,7 +12,12 @@ class MetricsMiddleware:
 
     def __init__(self, app):
         self.app = app
-        self._active_request_count = 0
+        # Labeled children cached per label tuple: labels() does a dict
+        # lookup plus tuple hash on every call, so resolve each child
+        # once and reuse it on the hot path
+        self._request_children = {}
+        self._duration_children = {}
+        self._error_children = {}
 
     async def __call__(self, scope, receive, send):
         # Only HTTP requests
@@ -22,45 +25,83 @@ class MetricsMiddleware:
             await self.app(scope, receive, send)
             return
 
-        # active requests++
-        self._active_request_count += 1
-        active_requests.set(self._active_request_count)
+        # active requests++ — the Gauge's own atomic increment replaces
+        # the racey Python-side counter + set() round trip
+        active_requests.inc()
 
-        # last request time
-        record_request_timestamp()
+        # Bind hot names to locals: the closure then loads them with
+        # LOAD_FAST/LOAD_DEREF instead of a global or attribute lookup
+        # on every send event
+        _perf_counter = time.perf_counter
+        _dec_active = active_requests.dec
+        _request_children = self._request_children
+        _duration_children = self._duration_children
+        _error_children = self._error_children
 
-        start_time = time.time()
-        endpoint = scope.get("path", "unknown")
+        # perf_counter is monotonic: durations can't jump on NTP clock
+        # adjustments, and the clock read is cheaper than CLOCK_REALTIME
+        start_time = _perf_counter()
         method = scope.get("method", "unknown")
+        recorded = False
 
         async def send_with_metrics(message):
+            nonlocal recorded
+            # Metrics are recorded once, on http.response.start; after
+            # that every body chunk takes this single-flag early exit
+            # instead of re-comparing the message type
+            if recorded:
+                await send(message)
+                return
+
             if message["type"] == "http.response.start":
+                recorded = True
                 status_code = message["status"]
-                duration = time.time() - start_time
+                duration = _perf_counter() - start_time
+
+                # Label with the matched route template (/docs/{doc_id})
+                # rather than the raw path: path params would otherwise
+                # mint a new label set per value, growing the metrics
+                # registry without bound and defeating the child cache.
+                # The router has already run by response start, so the
+                # matched route sits in the scope — no regex table walk
+                # needed.
+                route = scope.get("route")
+                endpoint = getattr(route, "path", "unknown")
 
                 # total requests
-                api_requests_total.labels(
-                    method=method,
-                    endpoint=endpoint,
-                    status=status_code,
-                ).inc()
+                key = (method, endpoint, status_code)
+                child = _request_children.get(key)
+                if child is None:
+                    child = _request_children[key] = api_requests_total.labels(
+                        method=method,
+                        endpoint=endpoint,
+                        status=status_code,
+                    )
+                child.inc()
 
                 # duration histogram
-                request_duration_seconds.labels(
-                    method=method,
-                    endpoint=endpoint,
-                ).observe(duration)
+                key = (method, endpoint)
+                child = _duration_children.get(key)
+                if child is None:
+                    child = _duration_children[key] = request_duration_seconds.labels(
+                        method=method,
+                        endpoint=endpoint,
+                    )
+                child.observe(duration)
 
                 # errors counter
                 if status_code >= 400:
-                    errors_total.labels(
-                        error_type=f"http_{status_code}",
-                        endpoint=endpoint,
-                    ).inc()
+                    key = (status_code, endpoint)
+                    child = _error_children.get(key)
+                    if child is None:
+                        child = _error_children[key] = errors_total.labels(
+                            error_type=f"http_{status_code}",
+                            endpoint=endpoint,
+                        )
+                    child.inc()
 
                 # active requests--
-                self._active_request_count -= 1
-                active_requests.set(self._active_request_count)
+                _dec_active()
 
             await send(message)
 
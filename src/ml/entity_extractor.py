@@ -5,11 +5,36 @@ Focuses on: parties, amounts, deadlines, conditions, numerics.
 
 import logging
 import re
-from typing import Dict, Any, List
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(slots=True)
+class Entities:
+    """Entities extracted from one clause. Slotted to keep the
+    per-clause footprint small on documents with many clauses."""
+
+    party_1: Optional[str] = None
+    party_2: Optional[str] = None
+    amount: Optional[str] = None
+    deadline: Optional[str] = None
+    conditions: bool = False
+    numerics: List[str] = field(default_factory=list)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Plain dict for the JSON API boundary."""
+        return {
+            "party_1": self.party_1,
+            "party_2": self.party_2,
+            "amount": self.amount,
+            "deadline": self.deadline,
+            "conditions": self.conditions,
+            "numerics": self.numerics,
+        }
+
+
 class EntityExtractor:
     """Extract key entities from legal text."""
 
@@ -22,19 +47,28 @@ class EntityExtractor:
     ]
 
     # Currency patterns
-    CURRENCY_PATTERNS = [
+    CURRENCY_PATTERNS = (
         r"\$\s?\d[\d,]*(?:\.\d{2})?",  # $1000, $1,000.00
         r"\d[\d,]*(?:\.\d{2})?\s?(?:USD|EUR|GBP|INR)",  # 1000 USD
         r"(?:USD|EUR|GBP|INR)\s?\d[\d,]*(?:\.\d{2})?",  # USD 1000
-    ]
+    )
 
     # Time/deadline patterns
-    TIME_PATTERNS = [
-        r"\d+\s+(?:day|week|month|year)s?",  # 30 days
+    TIME_PATTERNS = (
         r"within\s+\d+\s+(?:day|week|month|year)s?",  # within 30 days
         r"before\s+\d+\s+(?:day|week|month|year)s?",  # before 30 days
+        r"\d+\s+(?:day|week|month|year)s?",  # 30 days
         r"(?:by|on|before)\s+\w+\s+\d{1,2},?\s+\d{4}",  # by Jan 1, 2024
-    ]
+    )
+
+    # Each group fused into one alternation so a clause is scanned once
+    # instead of once per pattern
+    CURRENCY_RE = re.compile(
+        "|".join(f"(?:{p})" for p in CURRENCY_PATTERNS), re.IGNORECASE
+    )
+    TIME_RE = re.compile(
+        "|".join(f"(?:{p})" for p in TIME_PATTERNS), re.IGNORECASE
+    )
 
     # Condition keywords
     CONDITION_KEYWORDS = [
@@ -42,49 +76,54 @@ class EntityExtractor:
         "contingent", "conditional", "in the event", "should",
     ]
 
+    # All party keywords as one alternation — a single scan of the
+    # clause replaces one search per keyword. Keywords are literals, so
+    # the alternation behaves like a multi-pattern string matcher.
+    PARTY_RE = re.compile(
+        r"\b(?:the\s+)?(" + "|".join(map(re.escape, PARTY_KEYWORDS)) + r")\b",
+        re.IGNORECASE,
+    )
+
+    # One C-level scan instead of one substring check per keyword;
+    # deliberately unanchored to match the old `kw in text` semantics
+    CONDITION_RE = re.compile(
+        "|".join(map(re.escape, CONDITION_KEYWORDS)), re.IGNORECASE
+    )
+
+    _NUMERIC_RE = re.compile(r"\b\d+\b")
+
     @classmethod
-    def extract_entities(cls, clause_text: str) -> Dict[str, Any]:
+    def extract_entities(cls, clause_text: str) -> Entities:
         """
         Extract entities from a single clause.
-        Returns dict with: party_1, party_2, amount, deadline, conditions, numerics
+        Returns Entities with: party_1, party_2, amount, deadline, conditions, numerics
         """
+        entities = Entities()
         if not clause_text:
-            return {}
-
-        entities = {
-            "party_1": None,
-            "party_2": None,
-            "amount": None,
-            "deadline": None,
-            "conditions": False,
-            "numerics": [],
-        }
-
-        text_lower = clause_text.lower()
+            return entities
 
         # Extract parties
         parties = cls._extract_parties(clause_text)
         if len(parties) >= 1:
-            entities["party_1"] = parties[0]
+            entities.party_1 = parties[0]
         if len(parties) >= 2:
-            entities["party_2"] = parties[1]
+            entities.party_2 = parties[1]
 
-        # Extract amounts
-        amounts = cls._extract_amounts(clause_text)
-        if amounts:
-            entities["amount"] = amounts[0]  # Take first
-
-        # Extract deadlines
-        deadlines = cls._extract_deadlines(clause_text)
-        if deadlines:
-            entities["deadline"] = deadlines[0]  # Take first
+        # Only the first amount/deadline is kept, so stop scanning at
+        # the first hit instead of materializing the full match lists
+        entities.amount = cls._first_amount(clause_text)
+        entities.deadline = cls._first_deadline(clause_text)
 
         # Check for conditions
-        entities["conditions"] = any(kw in text_lower for kw in cls.CONDITION_KEYWORDS)
+        entities.conditions = cls.CONDITION_RE.search(clause_text) is not None
 
-        # Extract numerics (all numbers)
-        numerics = re.findall(r"\b\d+\b", clause_text)
-        entities["numerics"] = numerics[:5]  # Max 5
+        # Extract numerics — finditer with an early break keeps at most
+        # 5 without materializing every digit run in the clause
+        numerics = entities.numerics
+        for match in cls._NUMERIC_RE.finditer(clause_text):
+            numerics.append(match.group(0))
+            if len(numerics) == 5:  # Max 5
+                break
 
         return entities
 
@@ -92,30 +131,32 @@ class EntityExtractor:
     def _extract_parties(cls, text: str) -> List[str]:
         """Extract legal parties (buyer, seller, etc.) from text."""
         found = []
-        text_lower = text.lower()
-
-        for keyword in cls.PARTY_KEYWORDS:
-            # Look for "the buyer", "Buyer", etc.
-            pattern = r"\b(?:the\s+)?" + keyword + r"\b"
-            if re.search(pattern, text_lower):
+        seen = set()
+        for match in cls.PARTY_RE.finditer(text):
+            keyword = match.group(1).lower()
+            if keyword not in seen:
+                seen.add(keyword)
                 found.append(keyword)
-
         return found
 
+    @classmethod
+    def _first_amount(cls, text: str):
+        """First currency amount, or None — search stops at first hit."""
+        m = cls.CURRENCY_RE.search(text)
+        return m.group(0) if m else None
+
+    @classmethod
+    def _first_deadline(cls, text: str):
+        """First time/deadline expression, or None."""
+        m = cls.TIME_RE.search(text)
+        return m.group(0) if m else None
+
     @classmethod
     def _extract_amounts(cls, text: str) -> List[str]:
         """Extract currency amounts."""
-        amounts = []
-        for pattern in cls.CURRENCY_PATTERNS:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            amounts.extend(matches)
-        return amounts
+        return cls.CURRENCY_RE.findall(text)
 
     @classmethod
     def _extract_deadlines(cls, text: str) -> List[str]:
         """Extract time/deadline expressions."""
-        deadlines = []
-        for pattern in cls.TIME_PATTERNS:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            deadlines.extend(matches)
-        return deadlines
+        return cls.TIME_RE.findall(text)
@@ -5,7 +5,8 @@ Uses keyword patterns + clause type heuristics.
 
 import logging
 import re
-from typing import Dict
+
+from src.ml.entity_extractor import Entities
 
 logger = logging.getLogger(__name__)
 
@@ -14,27 +15,44 @@ class RiskAssessor:
     """Assess risk level of legal clauses."""
 
     # High risk keywords (3 points each)
-    HIGH_RISK_KEYWORDS = [
+    HIGH_RISK_KEYWORDS = (
         r"\bpenalty\b", r"\bliability\b", r"\bindemnif(?:y|ication)\b",
         r"\bbreach\b", r"\bterminat(?:e|ion)\b", r"\bwaive\b",
         r"\bunlimited\b", r"\bdamage(?:s)?\b", r"\bforfeiture\b",
         r"\bdefault\b", r"\bsever(?:able|ance)\b",
-    ]
+    )
 
     # Medium risk keywords (2 points each)
-    MEDIUM_RISK_KEYWORDS = [
+    MEDIUM_RISK_KEYWORDS = (
         r"\bshall\b", r"\bmust\b", r"\bobligat(?:ed|ion)\b",
         r"\bwithin\s+\d+\s+days\b", r"\brequired to\b",
         r"\bcontingent\b", r"\bconditional\b", r"\bprovided that\b",
         r"\brestrict(?:ion|ed)?\b", r"\bprohibit(?:ed)?\b",
-    ]
+    )
 
     # Low risk keywords (-1 point each, reduces score)
-    LOW_RISK_KEYWORDS = [
+    LOW_RISK_KEYWORDS = (
         r"\bdefinition\b", r"\bmeans\b", r"\bfor clarity\b",
         r"\bas follows\b", r"\bbackground\b", r"\brecital\b",
         r"\badministrative\b", r"\binformational\b",
-    ]
+    )
+
+    # One alternation per tier: a single linear scan of the clause
+    # replaces one search per keyword. Named groups identify which
+    # keyword hit, so each keyword still scores at most once however
+    # often it repeats.
+    _HIGH_RE = re.compile(
+        "|".join(f"(?P<h{i}>{p})" for i, p in enumerate(HIGH_RISK_KEYWORDS)),
+        re.IGNORECASE,
+    )
+    _MEDIUM_RE = re.compile(
+        "|".join(f"(?P<m{i}>{p})" for i, p in enumerate(MEDIUM_RISK_KEYWORDS)),
+        re.IGNORECASE,
+    )
+    _LOW_RE = re.compile(
+        "|".join(f"(?P<l{i}>{p})" for i, p in enumerate(LOW_RISK_KEYWORDS)),
+        re.IGNORECASE,
+    )
 
     # Risk by clause type
     TYPE_RISK_SCORES = {
@@ -50,7 +68,7 @@ class RiskAssessor:
     }
 
     @classmethod
-    def assess_risk(cls, clause_text: str, clause_type: str, entities: Dict) -> str:
+    def assess_risk(cls, clause_text: str, clause_type: str, entities: Entities) -> str:
         """
         Assess risk level for a clause.
         Returns: "low", "medium", or "high"
@@ -58,31 +76,20 @@ class RiskAssessor:
         if not clause_text:
             return "low"
 
-        score = 0
-        text_lower = clause_text.lower()
-
-        # Score keywords
-        for pattern in cls.HIGH_RISK_KEYWORDS:
-            if re.search(pattern, text_lower):
-                score += 3
-
-        for pattern in cls.MEDIUM_RISK_KEYWORDS:
-            if re.search(pattern, text_lower):
-                score += 2
-
-        for pattern in cls.LOW_RISK_KEYWORDS:
-            if re.search(pattern, text_lower):
-                score -= 1
+        # Score keywords — one pass per tier, counting distinct keywords
+        score = 3 * len({m.lastgroup for m in cls._HIGH_RE.finditer(clause_text)})
+        score += 2 * len({m.lastgroup for m in cls._MEDIUM_RE.finditer(clause_text)})
+        score -= len({m.lastgroup for m in cls._LOW_RE.finditer(clause_text)})
 
         # Score by type
         score += cls.TYPE_RISK_SCORES.get(clause_type, 0)
 
         # Additional scoring from entities
-        if entities.get("amount"):
+        if entities.amount:
             score += 1  # Money = risk
-        if entities.get("deadline"):
+        if entities.deadline:
             score += 1  # Time-sensitive = risk
-        if entities.get("conditions"):
+        if entities.conditions:
             score += 1  # Conditional = risk
 
         # Thresholds
@@ -0,0 +1,54 @@
+"""
+Rule Set: one handle over every compiled ML regex.
+
+The extractor/assessor/simplifier classes compile their patterns in
+their class bodies, so all compilation happens once at import. Under a
+preloading server (gunicorn --preload / uvicorn workers) the master
+process imports first and forked workers share the compiled patterns
+copy-on-write. This module adds a single cached factory so lazy code
+paths — scripts, notebooks, non-prefork deployments — get the same
+"compile exactly once per process" guarantee and a stable object to
+pass around or memoize.
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Pattern
+
+from src.ml.clause_extractor import ClauseExtractor
+from src.ml.entity_extractor import EntityExtractor
+from src.ml.risk_assessor import RiskAssessor
+from src.ml.rule_based_simplifier import RuleBasedSimplifier
+
+
+@dataclass(frozen=True)
+class RuleSet:
+    """Read-only bundle of the fused, precompiled rule regexes."""
+
+    clause_type_re: Pattern
+    party_re: Pattern
+    currency_re: Pattern
+    time_re: Pattern
+    condition_re: Pattern
+    high_risk_re: Pattern
+    medium_risk_re: Pattern
+    low_risk_re: Pattern
+    lexical_sub_re: Pattern
+    break_re: Pattern
+
+
+@lru_cache(maxsize=1)
+def get_rule_set() -> RuleSet:
+    """Return the process-wide rule set, built on first use."""
+    return RuleSet(
+        clause_type_re=ClauseExtractor._TYPE_RE,
+        party_re=EntityExtractor.PARTY_RE,
+        currency_re=EntityExtractor.CURRENCY_RE,
+        time_re=EntityExtractor.TIME_RE,
+        condition_re=EntityExtractor.CONDITION_RE,
+        high_risk_re=RiskAssessor._HIGH_RE,
+        medium_risk_re=RiskAssessor._MEDIUM_RE,
+        low_risk_re=RiskAssessor._LOW_RE,
+        lexical_sub_re=RuleBasedSimplifier._SUB_RE,
+        break_re=RuleBasedSimplifier._BREAK_RE,
+    )
@@ -1,7 +1,7 @@
 """Database models for legal documents"""
 
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean
+from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, Index
 from sqlalchemy.sql import func
 
 from src.database import Base
@@ -46,7 +46,14 @@ class RiskFlag(Base):
     """Model for identified risks in documents"""
     
     __tablename__ = "risk_flags"
-    
+
+    # Composite index: risk listings filter by document and level
+    # together, so cover both in one index instead of scanning the
+    # document_id index and filtering
+    __table_args__ = (
+        Index("ix_riskflags_doc_level", "document_id", "risk_level"),
+    )
+
     id = Column(Integer, primary_key=True, index=True)
     
     # Foreign key to document
@@ -1,5 +1,4 @@
 from prometheus_client import Counter, Histogram, Gauge
-import time
 
 # -------------------- HTTP-level Counters --------------------
 
@@ -31,15 +30,9 @@ active_requests = Gauge(
     "Number of currently active requests",
 )
 
-last_request_timestamp = Gauge(
-    "last_request_timestamp_seconds",
-    "Timestamp of last received request",
-)
-
-
-def record_request_timestamp() -> None:
-    """Set gauge to current UNIX timestamp."""
-    last_request_timestamp.set(time.time())
+# "Last request seen" is derived in PromQL via
+# timestamp(api_requests_total) — a dedicated gauge written behind the
+# client lock on every request added contention for no extra signal.
 
 
 # ======================================================================
@@ -59,7 +52,7 @@ documents_processed_total = Counter(
 simplifications_total = Counter(
     "simplifications_total",
     "Total simplifications performed by document type",
-    ["document_type"],  # contract | policy | text | unknown ...
+    ["document_type"],  # see _ALLOWED_DOC_TYPES below
 )
 
 simplification_duration_seconds = Histogram(
@@ -81,19 +74,43 @@ analysis_duration_seconds = Histogram(
 
 # ======================================================================
 # Helper functions for routes
+#
+# Every label value recorded here must come from a bounded set — each
+# new value mints a child series in the registry for the life of the
+# process, so adding a label (or widening an allow-list) needs a
+# cardinality review first.
 # ======================================================================
 
+# document_type is caller-supplied free text; coerce anything outside
+# the allow-list to "other" so the series count stays fixed
+_ALLOWED_DOC_TYPES = frozenset({"contract", "policy", "nda", "lease", "text", "other"})
+
+
 def record_document_operation(operation: str) -> None:
     """Increment document operation counter."""
     documents_processed_total.labels(operation=operation).inc()
 
 
-def record_simplification(duration: float, document_type: str = "unknown") -> None:
+def record_simplification(duration: float, document_type: str = "other") -> None:
     """Record a simplification operation and its duration."""
+    if document_type not in _ALLOWED_DOC_TYPES:
+        document_type = "other"
     simplifications_total.labels(document_type=document_type).inc()
     simplification_duration_seconds.labels(document_type=document_type).observe(duration)
 
 
+def record_request(method: str, route_template: str, status: int) -> None:
+    """Count one request against its route template.
+
+    Pass the matched route template (e.g. "/documents/{id}"), never the
+    raw path — path parameters would grow the series count linearly
+    with documents.
+    """
+    api_requests_total.labels(
+        method=method, endpoint=route_template, status=status
+    ).inc()
+
+
 def record_analysis(duration: float, analysis_type: str = "basic") -> None:
     """Record analysis duration for a given analysis type."""
     analysis_duration_seconds.labels(analysis_type=analysis_type).observe(duration)
@@ -1,6 +1,18 @@
-"""Pipelines for document processing"""
+"""Pipelines for document processing.
 
-from src.pipelines.simplification import get_simplification_pipeline
-from src.pipelines.risk_detection import get_risk_detector
+Exports resolve lazily (PEP 562) so importing the package — or only
+needing get_risk_detector — doesn't pull in the heavy transformers and
+torch imports behind the simplification pipeline.
+"""
 
 __all__ = ["get_simplification_pipeline", "get_risk_detector"]
+
+
+def __getattr__(name):
+    if name == "get_simplification_pipeline":
+        from src.pipelines.simplification import get_simplification_pipeline
+        return get_simplification_pipeline
+    if name == "get_risk_detector":
+        from src.pipelines.risk_detection import get_risk_detector
+        return get_risk_detector
+    raise AttributeError(name)
@@ -13,13 +13,14 @@ import json
 import logging
 import re
 import traceback
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 
 import torch
 from transformers import BartForConditionalGeneration, BartTokenizer
 
+from src.config import settings
 from src.ml.prompt_templates import build_clause_explanation_prompt
-from src.ml.clause_extractor import ClauseExtractor
+from src.ml.clause_extractor import Clause, ClauseExtractor
 from src.ml.entity_extractor import EntityExtractor
 from src.ml.risk_assessor import RiskAssessor
 from src.ml.rule_based_simplifier import RuleBasedSimplifier
@@ -28,6 +29,51 @@ from src.validators.simplify_validators import SimplifyValidator
 logger = logging.getLogger(__name__)
 
 
+# Field-extraction patterns, compiled once at import and unioned per
+# category so each extractor does a single scan of the clause. Raw
+# strings passed to re.findall in a loop leaned on the re module's
+# bounded pattern cache, which churns under load.
+# Party and coverage alternatives carry a category as their group name
+# so one finditer over a clause buckets every hit — compound parties,
+# single-word parties and coverage terms — in a single scan.
+_PARTY_COVERAGE_RE = re.compile(
+    r'(?P<party_compound>'
+    r'\b(?:Receiving Party|Disclosing Party|Indemnifying Party|Indemnified Party|Licensing Party|Licensed Party)\b'
+    r'|\b(?:First Party|Second Party|Third Party)\b'
+    r')'
+    r'|(?P<party_single>'
+    r'\b(?:Company|Client|Vendor|Customer|Applicant|Court|Licensor|Licensee|Employer|Employee)\b'
+    r'|\b(?:Plaintiff|Defendant|Petitioner|Respondent|Grantor|Grantee)\b'
+    r'|\b(?:its officers?|directors?|employees?|agents?|successors?|assigns?|affiliates?)\b'
+    r')'
+    r'|(?P<coverage>'
+    # Contract/tort
+    r'\b(?:claims?|damages?|losses?|liabilities?|costs?|expenses?|fees?|penalties?)\b'
+    r'|\b(?:breach|misconduct|negligence|violation|failure|default)\b'
+    r'|\b(?:compensation|indemnification|protection|defense|reimbursement)\b'
+    # Confidentiality/IP
+    r'|\b(?:Confidential Information|confidential|proprietary information|trade secrets?)\b'
+    r'|\b(?:disclosure|use|dissemination|reproduction|distribution)\b'
+    r'|\b(?:inventions?|patents?|copyrights?|trademarks?|intellectual property)\b'
+    # Employment
+    r'|\b(?:employment|services|work product|non-compete)\b'
+    # General obligations
+    r'|\b(?:obligations?|duties|rights|restrictions?|limitations?|prohibitions?)\b'
+    r')',
+    re.IGNORECASE,
+)
+
+_EXCEPTION_RE = re.compile(
+    # Capture from exception keyword to end of list (including (a), (b), (c))
+    r'((?:except|provided|however|unless|but|excluding)[^.]*(?:\([a-z]\)[^.]*)*)'
+    r'|(does not apply[^.]*(?:\([a-z]\)[^.]*)*)'
+    r'|(no obligation[^.]*(?:\([a-z]\)[^.]*)*)'
+    r'|(may[^.]*discretion[^.]*)'
+    r'|(shall not apply[^.]*(?:\([a-z]\)[^.]*)*)',
+    re.IGNORECASE | re.DOTALL,
+)
+
+
 class SimplificationPipeline:
     """
     Hybrid pipeline: Rule-based simplification + ML-powered extraction.
@@ -45,28 +91,61 @@ class SimplificationPipeline:
         self.current_model = self.MODEL_NAME
         SimplifyValidator.init_known_bad()
 
+        # BART loads lazily on first _generate call: the current
+        # simplify() flow is rule-based and never generates, so eager
+        # loading cost hundreds of MB and seconds of startup in every
+        # worker for a path that usually never runs
+        self.tokenizer = None
+        self.model = None
+        self.device = None
+        self.torch_dtype = None
+
+    def _ensure_model(self):
+        """Load model and tokenizer on first use; no-op afterwards."""
+        if self.model is not None:
+            return
+
         logger.info(f"Loading BART model: {self.MODEL_NAME}")
+        # Half-precision weights: FP16 on CUDA, BF16 on CPU. Halving
+        # bit-width halves memory traffic on this bandwidth-bound model;
+        # SDPA attention avoids the eager-mode attention materialization.
+        device = "cuda" if torch.cuda.is_available() else "cpu"
+        torch_dtype = torch.float16 if device == "cuda" else torch.bfloat16
         try:
             self.tokenizer = BartTokenizer.from_pretrained(self.MODEL_NAME)
-            device = "cuda" if torch.cuda.is_available() else "cpu"
             self.model = BartForConditionalGeneration.from_pretrained(
-                self.MODEL_NAME
+                self.MODEL_NAME,
+                torch_dtype=torch_dtype,
+                attn_implementation="sdpa",
             ).to(device)
-            self.device = device
             logger.info(f"✓ BART model loaded successfully on device: {device}")
         except Exception as e:
             logger.warning(
                 f"Failed to load {self.MODEL_NAME}, falling back: {type(e).__name__}: {e}"
             )
             self.tokenizer = BartTokenizer.from_pretrained(self.FALLBACK_MODEL)
-            device = "cuda" if torch.cuda.is_available() else "cpu"
             self.model = BartForConditionalGeneration.from_pretrained(
-                self.FALLBACK_MODEL
+                self.FALLBACK_MODEL,
+                torch_dtype=torch_dtype,
+                attn_implementation="sdpa",
             ).to(device)
-            self.device = device
             self.current_model = self.FALLBACK_MODEL
             logger.info(f"✓ BART fallback model loaded on device: {device}")
 
+        # On CPU the FP32/BF16 Linear layers are bandwidth-bound; dynamic
+        # int8 quantization quarters their weight bytes and uses int8 dot
+        # products where the CPU supports them. QUANTIZE_MODEL=false
+        # restores the unquantized model for debugging.
+        if device == "cpu" and settings.quantize_model:
+            self.model = torch.quantization.quantize_dynamic(
+                self.model.float(), {torch.nn.Linear}, dtype=torch.qint8
+            )
+            logger.info("✓ Applied dynamic int8 quantization to Linear layers")
+
+        self.device = device
+        self.torch_dtype = torch_dtype
+        self.model.eval()
+
     def simplify(
         self,
         text: str,
@@ -109,16 +188,16 @@ class SimplificationPipeline:
         except Exception as e:
             logger.error(f"Clause extraction failed: {type(e).__name__}: {e}")
             raw_clauses = [
-                {"id": "clause_1", "original_text": original_text, "type": "general"}
+                Clause(id="clause_1", original_text=original_text, type="general")
             ]
 
         processed_clauses = []
         pipeline_warnings = []
 
         for raw_clause in raw_clauses:
-            clause_id = raw_clause.get("id", "clause_unknown")
-            clause_type = raw_clause.get("type", "general")
-            clause_text = raw_clause.get("original_text", "").strip()
+            clause_id = raw_clause.id
+            clause_type = raw_clause.type
+            clause_text = raw_clause.original_text.strip()
 
             if not clause_text:
                 continue
@@ -138,11 +217,11 @@ class SimplificationPipeline:
 
             # Clause warnings
             clause_warnings = list(explanation_warnings)
-            if entities.get("numerics"):
+            if entities.numerics:
                 clause_warnings.append("numerics_present")
-            if entities.get("deadline"):
+            if entities.deadline:
                 clause_warnings.append("time_sensitive")
-            if entities.get("conditions"):
+            if entities.conditions:
                 clause_warnings.append("conditional_clause")
 
             processed_clauses.append(
@@ -152,7 +231,7 @@ class SimplificationPipeline:
                     "original_text": clause_text,
                     "explanation": explanation,
                     "risk_level": risk_level,
-                    "key_entities": entities,
+                    "key_entities": entities.as_dict(),
                     "warnings": clause_warnings,
                 }
             )
@@ -208,9 +287,9 @@ class SimplificationPipeline:
             text=clause_text, preserve_structure=True, aggressive=False
         )
 
-        # Step 2: Extract structured fields from the ORIGINAL clause
-        who_protected = self._extract_parties(clause_text, summary)
-        what_covered = self._extract_coverage(clause_text, summary)
+        # Step 2: Extract structured fields from the ORIGINAL clause —
+        # parties and coverage come out of one shared scan
+        who_protected, what_covered = self._extract_parties_and_coverage(clause_text)
         exceptions = self._extract_exceptions(clause_text, summary)
 
         # Step 3: Apply rules to each extracted field for cleanup
@@ -249,104 +328,52 @@ class SimplificationPipeline:
     # -------------------------------------------------------------------------
 
     @staticmethod
-    def _extract_parties(original: str, simplified: str) -> str:
-        """Extract party information from clause - prioritize compound names."""
-        # First try compound party names (2-3 words)
-        compound_patterns = [
-            r'\b(Receiving Party|Disclosing Party|Indemnifying Party|Indemnified Party|Licensing Party|Licensed Party)\b',
-            r'\b(First Party|Second Party|Third Party)\b',
-        ]
-        
-        found_parties = set()
-        
-        # Try compound names first
-        for pattern in compound_patterns:
-            matches = re.findall(pattern, original, re.IGNORECASE)
-            found_parties.update(matches)
-        
-        # If compound names found, use those exclusively
-        if found_parties:
-            parties_list = sorted(set(p.strip() for p in found_parties))[:4]
-            return ", ".join(parties_list)
-        
-        # Otherwise, fall back to single-word party names
-        single_party_patterns = [
-            r'\b(Company|Client|Vendor|Customer|Applicant|Court|Licensor|Licensee|Employer|Employee)\b',
-            r'\b(Plaintiff|Defendant|Petitioner|Respondent|Grantor|Grantee)\b',
-            r'\b(its officers?|directors?|employees?|agents?|successors?|assigns?|affiliates?)\b',
-        ]
-        
-        for pattern in single_party_patterns:
-            matches = re.findall(pattern, original, re.IGNORECASE)
-            found_parties.update(matches)
-        
-        if found_parties:
-            parties_list = sorted(set(p.strip() for p in found_parties))[:4]
-            return ", ".join(parties_list)
+    def _extract_parties_and_coverage(original: str) -> (str, str):
+        """Extract party and coverage fields from one scan of the clause.
 
-        return "The parties mentioned in the clause"
+        A single finditer over _PARTY_COVERAGE_RE buckets every hit by
+        its category group, replacing the separate party and coverage
+        scans over the same bytes.
+        """
+        buckets = {"party_compound": set(), "party_single": set(), "coverage": set()}
+        for m in _PARTY_COVERAGE_RE.finditer(original):
+            buckets[m.lastgroup].add(m.group(0))
 
-    @staticmethod
-    def _extract_coverage(original: str, simplified: str) -> str:
-        """Extract what is covered/protected - broader patterns."""
-        # Broader coverage patterns including NDA/confidentiality terms
-        coverage_keywords = [
-            # Contract/tort
-            r'\b(claims?|damages?|losses?|liabilities?|costs?|expenses?|fees?|penalties?)\b',
-            r'\b(breach|misconduct|negligence|violation|failure|default)\b',
-            r'\b(compensation|indemnification|protection|defense|reimbursement)\b',
-            
-            # Confidentiality/IP
-            r'\b(Confidential Information|confidential|proprietary information|trade secrets?)\b',
-            r'\b(disclosure|use|dissemination|reproduction|distribution)\b',
-            r'\b(inventions?|patents?|copyrights?|trademarks?|intellectual property)\b',
-            
-            # Employment
-            r'\b(employment|services|work product|non-compete)\b',
-            
-            # General obligations
-            r'\b(obligations?|duties|rights|restrictions?|limitations?|prohibitions?)\b',
-        ]
-
-        found_items = set()
-        for pattern in coverage_keywords:
-            matches = re.findall(pattern, original, re.IGNORECASE)
-            found_items.update(matches)
+        # Compound party names (2-3 words) win exclusively over
+        # single-word fallbacks
+        found_parties = buckets["party_compound"] or buckets["party_single"]
+        if found_parties:
+            parties_list = sorted(set(p.strip() for p in found_parties))[:4]
+            who_protected = ", ".join(parties_list)
+        else:
+            who_protected = "The parties mentioned in the clause"
 
+        found_items = buckets["coverage"]
         if found_items:
             # Deduplicate and limit
             items_list = sorted(set(i.strip() for i in found_items))[:6]
-            return "Covers: " + ", ".join(items_list)
+            what_covered = "Covers: " + ", ".join(items_list)
+        else:
+            what_covered = "Coverage details in the original clause"
 
-        return "Coverage details in the original clause"
+        return who_protected, what_covered
 
     @staticmethod
     def _extract_exceptions(original: str, simplified: str) -> str:
         """Extract exception/limitation language - capture multi-part lists."""
-        # Look for exception patterns with extended capture (including list items)
-        exception_patterns = [
-            # Capture from exception keyword to end of list (including (a), (b), (c))
-            r'((?:except|provided|however|unless|but|excluding)[^.]*(?:\([a-z]\)[^.]*)*)',
-            r'(does not apply[^.]*(?:\([a-z]\)[^.]*)*)',
-            r'(no obligation[^.]*(?:\([a-z]\)[^.]*)*)',
-            r'(may[^.]*discretion[^.]*)',
-            r'(shall not apply[^.]*(?:\([a-z]\)[^.]*)*)',
-        ]
-
-        # Find exception clauses
+        # Find exception clauses in a single scan of the unioned
+        # patterns (see _EXCEPTION_RE)
         found_exceptions = []
-        
-        for pattern in exception_patterns:
-            matches = re.findall(pattern, original, re.IGNORECASE | re.DOTALL)
-            for match in matches:
-                cleaned = match.strip()
-                if len(cleaned) > 25:  # Skip very short matches
-                    # Apply rules to simplify
-                    simplified_exc = RuleBasedSimplifier.simplify(
-                        text=cleaned, preserve_structure=False
-                    )
-                    if simplified_exc:
-                        found_exceptions.append(simplified_exc)
+
+        for m in _EXCEPTION_RE.finditer(original):
+            cleaned = m.group(0).strip()
+            if len(cleaned) > 25:  # Skip very short matches
+                # Apply rules to simplify
+                simplified_exc = RuleBasedSimplifier.simplify(
+                    text=cleaned, preserve_structure=False
+                )
+                if simplified_exc:
+                    found_exceptions.append(simplified_exc)
 
         if found_exceptions:
             # Return the longest/most substantial exception
@@ -365,6 +392,7 @@ class SimplificationPipeline:
         Generic BART generation.
         Currently not used to avoid hallucinations, but kept for future enhancements.
         """
+        self._ensure_model()
         inputs = self.tokenizer(
             prompt,
             max_length=1024,
@@ -373,7 +401,9 @@ class SimplificationPipeline:
             padding=True,
         ).to(self.device)
 
-        with torch.no_grad():
+        with torch.inference_mode(), torch.autocast(
+            device_type=self.device, dtype=self.torch_dtype
+        ):
             out_ids = self.model.generate(
                 inputs["input_ids"],
                 attention_mask=inputs.get("attention_mask"),
@@ -395,6 +425,59 @@ class SimplificationPipeline:
             out_ids[0], skip_special_tokens=True, clean_up_tokenization_spaces=True
         ).strip()
 
+    def _generate_batch(
+        self, prompts: List[str], max_length: int = 256, min_length: int = 40
+    ) -> List[str]:
+        """
+        Batched BART generation with dynamic padding.
+
+        One padded forward pass over all prompts costs close to a single
+        sample, so multi-clause documents should prefer this over a loop
+        of _generate calls. Prompts are sorted by length before padding
+        to minimize wasted pad compute, and results are returned in the
+        caller's original order.
+        """
+        if not prompts:
+            return []
+
+        self._ensure_model()
+        order = sorted(range(len(prompts)), key=lambda i: len(prompts[i]), reverse=True)
+        inputs = self.tokenizer(
+            [prompts[i] for i in order],
+            max_length=1024,
+            truncation=True,
+            return_tensors="pt",
+            padding=True,
+        ).to(self.device)
+
+        with torch.inference_mode(), torch.autocast(
+            device_type=self.device, dtype=self.torch_dtype
+        ):
+            out_ids = self.model.generate(
+                inputs["input_ids"],
+                attention_mask=inputs.get("attention_mask"),
+                max_length=max_length,
+                min_length=min_length,
+                num_beams=4,
+                early_stopping=True,
+                do_sample=True,
+                temperature=0.8,
+                top_p=0.9,
+                top_k=50,
+                no_repeat_ngram_size=3,
+                repetition_penalty=1.2,
+                length_penalty=0.9,
+                encoder_no_repeat_ngram_size=3,
+            )
+
+        decoded = self.tokenizer.batch_decode(
+            out_ids, skip_special_tokens=True, clean_up_tokenization_spaces=True
+        )
+        results = [""] * len(prompts)
+        for pos, i in enumerate(order):
+            results[i] = decoded[pos].strip()
+        return results
+
 
 _pipeline: Optional[SimplificationPipeline] = None
 
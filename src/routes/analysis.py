@@ -6,6 +6,7 @@ from typing import List, Optional
 
 from fastapi import APIRouter, HTTPException, Depends, Request
 from pydantic import BaseModel
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 from src.middleware import limiter
@@ -67,17 +68,23 @@ async def analyze_document(
         for risk in existing_risks:
             db.delete(risk)
 
-        # Insert new risks
-        for risk in detected_risks:
-            risk_flag = RiskFlag(
-                document_id=document_id,
-                risk_level=risk["risk_level"],
-                risk_score=risk["risk_score"],
-                clause_text=risk["clause_text"],
-                description=risk["description"],
-                recommendation=risk["recommendation"],
+        # Insert new risks in one bulk statement instead of a unit-of-
+        # work add() per row
+        if detected_risks:
+            db.execute(
+                insert(RiskFlag),
+                [
+                    {
+                        "document_id": document_id,
+                        "risk_level": risk["risk_level"],
+                        "risk_score": risk["risk_score"],
+                        "clause_text": risk["clause_text"],
+                        "description": risk["description"],
+                        "recommendation": risk["recommendation"],
+                    }
+                    for risk in detected_risks
+                ],
             )
-            db.add(risk_flag)
 
         db.commit()
 